@@ -261,13 +261,52 @@ impl IdStr {
 fn validate_blank_node_identifier(id: &str) -> Result<(), BlankNodeIdParseError> {
     let mut chars = id.chars();
     let front = chars.next().ok_or(BlankNodeIdParseError {})?;
-    match front {
-        '0'..='9'
-        | '_'
-        | ':'
-        | 'A'..='Z'
-        | 'a'..='z'
-        | '\u{00C0}'..='\u{00D6}'
+    if !is_blank_node_identifier_start_char(front) {
+        return Err(BlankNodeIdParseError {});
+    }
+    for c in chars {
+        if !is_blank_node_identifier_char(c) {
+            return Err(BlankNodeIdParseError {});
+        }
+    }
+
+    // Could not end with a dot
+    if id.ends_with('.') {
+        Err(BlankNodeIdParseError {})
+    } else {
+        Ok(())
+    }
+}
+
+const BLANK_NODE_ID_START_CHAR: u8 = 1;
+const BLANK_NODE_ID_CHAR: u8 = 2;
+
+/// Character class memberships of the ASCII chars, computed at compile time
+const ASCII_BLANK_NODE_ID_CHARS: [u8; 128] = build_ascii_blank_node_id_chars();
+
+const fn build_ascii_blank_node_id_chars() -> [u8; 128] {
+    let mut table = [0; 128];
+    let mut c: u8 = 0;
+    while c < 128 {
+        table[c as usize] = match c {
+            b'0'..=b'9' | b'_' | b':' | b'A'..=b'Z' | b'a'..=b'z' => {
+                BLANK_NODE_ID_START_CHAR | BLANK_NODE_ID_CHAR
+            }
+            b'.' // validated later
+            | b'-' => BLANK_NODE_ID_CHAR,
+            _ => 0,
+        };
+        c += 1;
+    }
+    table
+}
+
+fn is_blank_node_identifier_start_char(c: char) -> bool {
+    if c.is_ascii() {
+        return ASCII_BLANK_NODE_ID_CHARS[c as usize] & BLANK_NODE_ID_START_CHAR != 0;
+    }
+    matches!(c,
+        '\u{00C0}'..='\u{00D6}'
         | '\u{00D8}'..='\u{00F6}'
         | '\u{00F8}'..='\u{02FF}'
         | '\u{0370}'..='\u{037D}'
@@ -278,43 +317,18 @@ fn validate_blank_node_identifier(id: &str) -> Result<(), BlankNodeIdParseError>
         | '\u{3001}'..='\u{D7FF}'
         | '\u{F900}'..='\u{FDCF}'
         | '\u{FDF0}'..='\u{FFFD}'
-        | '\u{10000}'..='\u{EFFFF}' => (),
-        _ => return Err(BlankNodeIdParseError {}),
-    }
-    for c in chars {
-        match c {
-            '.' // validated later
-            | '-'
-            | '0'..='9'
-            | '\u{00B7}'
-            | '\u{0300}'..='\u{036F}'
-            | '\u{203F}'..='\u{2040}'
-            | '_'
-            | ':'
-            | 'A'..='Z'
-            | 'a'..='z'
-            | '\u{00C0}'..='\u{00D6}'
-            | '\u{00D8}'..='\u{00F6}'
-            | '\u{00F8}'..='\u{02FF}'
-            | '\u{0370}'..='\u{037D}'
-            | '\u{037F}'..='\u{1FFF}'
-            | '\u{200C}'..='\u{200D}'
-            | '\u{2070}'..='\u{218F}'
-            | '\u{2C00}'..='\u{2FEF}'
-            | '\u{3001}'..='\u{D7FF}'
-            | '\u{F900}'..='\u{FDCF}'
-            | '\u{FDF0}'..='\u{FFFD}'
-            | '\u{10000}'..='\u{EFFFF}' => (),
-            _ => return Err(BlankNodeIdParseError {}),
-        }
-    }
+        | '\u{10000}'..='\u{EFFFF}')
+}
 
-    // Could not end with a dot
-    if id.ends_with('.') {
-        Err(BlankNodeIdParseError {})
-    } else {
-        Ok(())
+fn is_blank_node_identifier_char(c: char) -> bool {
+    if c.is_ascii() {
+        return ASCII_BLANK_NODE_ID_CHARS[c as usize] & BLANK_NODE_ID_CHAR != 0;
     }
+    matches!(c,
+        '\u{00B7}'
+        | '\u{0300}'..='\u{036F}'
+        | '\u{203F}'..='\u{2040}')
+        || is_blank_node_identifier_start_char(c)
 }
 
 fn to_integer_id(id: &str) -> Option<u128> {
@@ -10,7 +10,7 @@ use pyo3::types::PyBytes;
 use pyo3::wrap_pyfunction;
 use pyo3::PyIterProtocol;
 use std::io;
-use std::io::{BufReader, Read, Write};
+use std::io::{BufRead, BufReader, BufWriter, Cursor, Read, Write};
 
 pub fn add_to_module(module: &PyModule) -> PyResult<()> {
     module.add_wrapped(wrap_pyfunction!(parse))?;
@@ -31,8 +31,8 @@ pub fn add_to_module(module: &PyModule) -> PyResult<()> {
 /// For example ``application/turtle`` could also be used for `Turtle <https://www.w3.org/TR/turtle/>`_
 /// and ``application/xml`` for `RDF/XML <https://www.w3.org/TR/rdf-syntax-grammar/>`_.
 ///
-/// :param input: The binary I/O object to read from. For example, it could be a file opened in binary mode with ``open('my_file.ttl', 'rb')``.
-/// :type input: io.RawIOBase or io.BufferedIOBase
+/// :param input: The binary I/O object to read from. For example, it could be a file opened in binary mode with ``open('my_file.ttl', 'rb')``. The serialization could also be given directly as :py:class:`bytes`.
+/// :type input: io.RawIOBase or io.BufferedIOBase or bytes
 /// :param mime_type: the MIME type of the RDF serialization
 /// :type mime_type: str
 /// :param base_iri: the base IRI used to resolve the relative IRIs in the file or :py:const:`None` if relative IRI resolution should not be done
@@ -45,6 +45,9 @@ pub fn add_to_module(module: &PyModule) -> PyResult<()> {
 /// >>> input = io.BytesIO(b'<foo> <p> "1" .')
 /// >>> list(parse(input, "text/turtle", base_iri="http://example.com/"))
 /// [<Triple subject=<NamedNode value=http://example.com/foo> predicate=<NamedNode value=http://example.com/p> object=<Literal value=1 datatype=<NamedNode value=http://www.w3.org/2001/XMLSchema#string>>>]
+///
+/// >>> list(parse(b'<foo> <p> "1" .', "text/turtle", base_iri="http://example.com/"))
+/// [<Triple subject=<NamedNode value=http://example.com/foo> predicate=<NamedNode value=http://example.com/p> object=<Literal value=1 datatype=<NamedNode value=http://www.w3.org/2001/XMLSchema#string>>>]
 #[pyfunction]
 #[pyo3(text_signature = "(input, /, mime_type, *, base_iri = None)")]
 pub fn parse(
@@ -53,7 +56,7 @@ pub fn parse(
     base_iri: Option<&str>,
     py: Python<'_>,
 ) -> PyResult<PyObject> {
-    let input = BufReader::new(PyFileLike::new(input));
+    let input = PyReadable::from_data(input, py);
     if let Some(graph_format) = GraphFormat::from_media_type(mime_type) {
         let mut parser = GraphParser::from_format(graph_format);
         if let Some(base_iri) = base_iri {
@@ -114,10 +117,10 @@ pub fn parse(
 #[pyfunction]
 #[pyo3(text_signature = "(input, output, /, mime_type, *, base_iri = None)")]
 pub fn serialize(input: &PyAny, output: PyObject, mime_type: &str) -> PyResult<()> {
-    let output = PyFileLike::new(output);
+    let mut output = BufWriter::new(PyFileLike::new(output));
     if let Some(graph_format) = GraphFormat::from_media_type(mime_type) {
         let mut writer = GraphSerializer::from_format(graph_format)
-            .triple_writer(output)
+            .triple_writer(&mut output)
             .map_err(map_io_err)?;
         for i in input.iter()? {
             writer
@@ -125,10 +128,11 @@ pub fn serialize(input: &PyAny, output: PyObject, mime_type: &str) -> PyResult<(
                 .map_err(map_io_err)?;
         }
         writer.finish().map_err(map_io_err)?;
+        output.into_inner().map_err(|e| map_io_err(e.into()))?;
         Ok(())
     } else if let Some(dataset_format) = DatasetFormat::from_media_type(mime_type) {
         let mut writer = DatasetSerializer::from_format(dataset_format)
-            .quad_writer(output)
+            .quad_writer(&mut output)
             .map_err(map_io_err)?;
         for i in input.iter()? {
             writer
@@ -136,6 +140,7 @@ pub fn serialize(input: &PyAny, output: PyObject, mime_type: &str) -> PyResult<(
                 .map_err(map_io_err)?;
         }
         writer.finish().map_err(map_io_err)?;
+        output.into_inner().map_err(|e| map_io_err(e.into()))?;
         Ok(())
     } else {
         Err(PyValueError::new_err(format!(
@@ -145,9 +150,9 @@ pub fn serialize(input: &PyAny, output: PyObject, mime_type: &str) -> PyResult<(
     }
 }
 
-#[pyclass(name = "TripleReader", module = "oxigraph")]
+#[pyclass(name = "TripleReader", module = "pyoxigraph")]
 pub struct PyTripleReader {
-    inner: TripleReader<BufReader<PyFileLike>>,
+    inner: TripleReader<PyReadable>,
 }
 
 #[pyproto]
@@ -164,9 +169,9 @@ impl PyIterProtocol for PyTripleReader {
     }
 }
 
-#[pyclass(name = "QuadReader", module = "oxigraph")]
+#[pyclass(name = "QuadReader", module = "pyoxigraph")]
 pub struct PyQuadReader {
-    inner: QuadReader<BufReader<PyFileLike>>,
+    inner: QuadReader<PyReadable>,
 }
 
 #[pyproto]
@@ -183,6 +188,47 @@ impl PyIterProtocol for PyQuadReader {
     }
 }
 
+pub enum PyReadable {
+    Bytes(Cursor<Vec<u8>>),
+    Io(BufReader<PyFileLike>),
+}
+
+impl PyReadable {
+    /// Copies the content of a Python ``bytes`` object once or falls back to a buffered Python file-like object
+    pub fn from_data(data: PyObject, py: Python<'_>) -> Self {
+        if let Ok(bytes) = data.extract::<&PyBytes>(py) {
+            Self::Bytes(Cursor::new(bytes.as_bytes().to_vec()))
+        } else {
+            Self::Io(BufReader::new(PyFileLike::new(data)))
+        }
+    }
+}
+
+impl Read for PyReadable {
+    fn read(&mut self, buf: &mut [u8]) -> io::Result<usize> {
+        match self {
+            Self::Bytes(bytes) => bytes.read(buf),
+            Self::Io(io) => io.read(buf),
+        }
+    }
+}
+
+impl BufRead for PyReadable {
+    fn fill_buf(&mut self) -> io::Result<&[u8]> {
+        match self {
+            Self::Bytes(bytes) => bytes.fill_buf(),
+            Self::Io(io) => io.fill_buf(),
+        }
+    }
+
+    fn consume(&mut self, amt: usize) {
+        match self {
+            Self::Bytes(bytes) => bytes.consume(amt),
+            Self::Io(io) => io.consume(amt),
+        }
+    }
+}
+
 pub struct PyFileLike {
     inner: PyObject,
 }
@@ -37,6 +37,7 @@ fn pyoxigraph(_py: Python<'_>, module: &PyModule) -> PyResult<()> {
     module.add_class::<PyMemoryStore>()?;
     module.add_class::<PySledStore>()?;
     module.add_class::<PyVariable>()?;
+    module.add_class::<PyQuery>()?;
     module.add_class::<PyQuerySolutions>()?;
     module.add_class::<PyQuerySolution>()?;
     module.add_class::<PyQueryTriples>()?;
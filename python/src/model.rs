@@ -3,6 +3,7 @@ use oxigraph::sparql::Variable;
 use pyo3::basic::CompareOp;
 use pyo3::exceptions::{PyIndexError, PyNotImplementedError, PyTypeError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyTuple};
 use pyo3::{PyIterProtocol, PyMappingProtocol, PyObjectProtocol, PyTypeInfo};
 use std::collections::hash_map::DefaultHasher;
 use std::convert::TryFrom;
@@ -20,7 +21,7 @@ use std::vec::IntoIter;
 ///
 /// >>> str(NamedNode('http://example.com'))
 /// '<http://example.com>'
-#[pyclass(name = "NamedNode", module = "oxigraph")]
+#[pyclass(name = "NamedNode", module = "pyoxigraph")]
 #[pyo3(text_signature = "(value)")]
 #[derive(Eq, PartialEq, Ord, PartialOrd, Debug, Clone, Hash)]
 pub struct PyNamedNode {
@@ -75,6 +76,18 @@ impl PyNamedNode {
     fn value(&self) -> &str {
         self.inner.as_str()
     }
+
+    fn __getnewargs__(&self) -> (&str,) {
+        (self.value(),)
+    }
+
+    fn __copy__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __deepcopy__<'a>(slf: PyRef<'a, Self>, _memo: &PyAny) -> PyRef<'a, Self> {
+        slf
+    }
 }
 
 #[pyproto]
@@ -119,7 +132,7 @@ impl PyObjectProtocol for PyNamedNode {
 ///
 /// >>> str(BlankNode('ex'))
 /// '_:ex'
-#[pyclass(name = "BlankNode", module = "oxigraph")]
+#[pyclass(name = "BlankNode", module = "pyoxigraph")]
 #[pyo3(text_signature = "(value)")]
 #[derive(Eq, PartialEq, Debug, Clone, Hash)]
 pub struct PyBlankNode {
@@ -177,6 +190,18 @@ impl PyBlankNode {
     fn value(&self) -> &str {
         self.inner.as_str()
     }
+
+    fn __getnewargs__(&self) -> (&str,) {
+        (self.value(),)
+    }
+
+    fn __copy__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __deepcopy__<'a>(slf: PyRef<'a, Self>, _memo: &PyAny) -> PyRef<'a, Self> {
+        slf
+    }
 }
 
 #[pyproto]
@@ -229,7 +254,7 @@ impl PyObjectProtocol for PyBlankNode {
 /// '"example"@en'
 /// >>> str(Literal('11', datatype=NamedNode('http://www.w3.org/2001/XMLSchema#integer')))
 /// '"11"^^<http://www.w3.org/2001/XMLSchema#integer>'
-#[pyclass(name = "Literal", module = "oxigraph")]
+#[pyclass(name = "Literal", module = "pyoxigraph")]
 #[pyo3(text_signature = "(value, *, datatype = None, language = None)")]
 #[derive(Eq, PartialEq, Debug, Clone, Hash)]
 pub struct PyLiteral {
@@ -316,6 +341,24 @@ impl PyLiteral {
     fn datatype(&self) -> PyNamedNode {
         self.inner.datatype().into_owned().into()
     }
+
+    fn __getnewargs_ex__<'p>(&self, py: Python<'p>) -> PyResult<((&str,), &'p PyDict)> {
+        let kwargs = PyDict::new(py);
+        if let Some(language) = self.language() {
+            kwargs.set_item("language", language)?;
+        } else {
+            kwargs.set_item("datatype", self.datatype().into_py(py))?;
+        }
+        Ok(((self.value(),), kwargs))
+    }
+
+    fn __copy__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __deepcopy__<'a>(slf: PyRef<'a, Self>, _memo: &PyAny) -> PyRef<'a, Self> {
+        slf
+    }
 }
 
 #[pyproto]
@@ -351,7 +394,7 @@ impl PyObjectProtocol for PyLiteral {
 }
 
 /// The RDF `default graph name <https://www.w3.org/TR/rdf11-concepts/#dfn-default-graph>`_
-#[pyclass(name = "DefaultGraph", module = "oxigraph")]
+#[pyclass(name = "DefaultGraph", module = "pyoxigraph")]
 #[derive(Eq, PartialEq, Debug, Clone, Copy, Hash)]
 pub struct PyDefaultGraph {}
 
@@ -372,6 +415,18 @@ impl PyDefaultGraph {
     fn value(&self) -> &str {
         ""
     }
+
+    fn __getnewargs__<'p>(&self, py: Python<'p>) -> &'p PyTuple {
+        PyTuple::empty(py)
+    }
+
+    fn __copy__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __deepcopy__<'a>(slf: PyRef<'a, Self>, _memo: &PyAny) -> PyRef<'a, Self> {
+        slf
+    }
 }
 
 #[pyproto]
@@ -491,7 +546,7 @@ impl IntoPy<PyObject> for PyTerm {
 /// A triple could also be easily destructed into its components:
 ///
 /// >>> (s, p, o) = Triple(NamedNode('http://example.com'), NamedNode('http://example.com/p'), Literal('1'))
-#[pyclass(name = "Triple", module = "oxigraph")]
+#[pyclass(name = "Triple", module = "pyoxigraph")]
 #[derive(Eq, PartialEq, Debug, Clone, Hash)]
 #[pyo3(text_signature = "(subject, predicate, object)")]
 pub struct PyTriple {
@@ -552,6 +607,18 @@ impl PyTriple {
     fn object(&self) -> PyTerm {
         self.inner.object.clone().into()
     }
+
+    fn __getnewargs__(&self) -> (PyNamedOrBlankNode, PyNamedNode, PyTerm) {
+        (self.subject(), self.predicate(), self.object())
+    }
+
+    fn __copy__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __deepcopy__<'a>(slf: PyRef<'a, Self>, _memo: &PyAny) -> PyRef<'a, Self> {
+        slf
+    }
 }
 
 #[pyproto]
@@ -671,7 +738,7 @@ impl IntoPy<PyObject> for PyGraphName {
 /// A quad could also be easily destructed into its components:
 ///
 /// >>> (s, p, o, g) = Quad(NamedNode('http://example.com'), NamedNode('http://example.com/p'), Literal('1'), NamedNode('http://example.com/g'))
-#[pyclass(name = "Quad", module = "oxigraph")]
+#[pyclass(name = "Quad", module = "pyoxigraph")]
 #[pyo3(text_signature = "(subject, predicate, object, graph_name = None)")]
 #[derive(Eq, PartialEq, Debug, Clone, Hash)]
 pub struct PyQuad {
@@ -763,6 +830,23 @@ impl PyQuad {
     fn triple(&self) -> PyTriple {
         Triple::from(self.inner.clone()).into()
     }
+
+    fn __getnewargs__(&self) -> (PyNamedOrBlankNode, PyNamedNode, PyTerm, PyGraphName) {
+        (
+            self.subject(),
+            self.predicate(),
+            self.object(),
+            self.graph_name(),
+        )
+    }
+
+    fn __copy__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __deepcopy__<'a>(slf: PyRef<'a, Self>, _memo: &PyAny) -> PyRef<'a, Self> {
+        slf
+    }
 }
 
 #[pyproto]
@@ -842,7 +926,7 @@ impl PyIterProtocol for PyQuad {
 ///
 /// >>> str(Variable('foo'))
 /// '?foo'
-#[pyclass(name = "Variable", module = "oxigraph")]
+#[pyclass(name = "Variable", module = "pyoxigraph")]
 #[pyo3(text_signature = "(value)")]
 #[derive(Eq, PartialEq, Debug, Clone, Hash)]
 pub struct PyVariable {
@@ -885,6 +969,18 @@ impl PyVariable {
     fn value(&self) -> &str {
         self.inner.as_str()
     }
+
+    fn __getnewargs__(&self) -> (&str,) {
+        (self.value(),)
+    }
+
+    fn __copy__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __deepcopy__<'a>(slf: PyRef<'a, Self>, _memo: &PyAny) -> PyRef<'a, Self> {
+        slf
+    }
 }
 
 #[pyproto]
@@ -1120,7 +1216,7 @@ fn graph_name_repr(term: GraphNameRef<'_>, buffer: &mut String) {
     }
 }
 
-#[pyclass(module = "oxigraph")]
+#[pyclass(module = "pyoxigraph")]
 pub struct TripleComponentsIter {
     inner: IntoIter<Term>,
 }
@@ -1136,7 +1232,7 @@ impl PyIterProtocol for TripleComponentsIter {
     }
 }
 
-#[pyclass(module = "oxigraph")]
+#[pyclass(module = "pyoxigraph")]
 pub struct QuadComponentsIter {
     inner: IntoIter<Option<Term>>,
 }
@@ -1,9 +1,9 @@
-use crate::io::PyFileLike;
+use crate::io::{PyFileLike, PyReadable};
 use crate::model::*;
 use crate::sparql::*;
 use crate::store_utils::*;
 use oxigraph::io::{DatasetFormat, GraphFormat};
-use oxigraph::model::GraphNameRef;
+use oxigraph::model::{GraphNameRef, Quad};
 use oxigraph::store::sled::*;
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::{
@@ -11,7 +11,8 @@ use pyo3::prelude::{
 };
 use pyo3::{PyIterProtocol, PyObjectProtocol, PySequenceProtocol};
 use std::convert::TryFrom;
-use std::io::BufReader;
+use std::io;
+use std::io::BufWriter;
 
 /// Store based on the `Sled <https://sled.rs/>`_ key-value database.
 ///
@@ -30,7 +31,7 @@ use std::io::BufReader;
 /// >>> store.add(Quad(NamedNode('http://example.com'), NamedNode('http://example.com/p'), Literal('1'), NamedNode('http://example.com/g')))
 /// >>> str(store)
 /// '<http://example.com> <http://example.com/p> "1" <http://example.com/g> .\n'
-#[pyclass(name = "SledStore", module = "oxigraph")]
+#[pyclass(name = "SledStore", module = "pyoxigraph")]
 #[pyo3(text_signature = "(path = None)")]
 #[derive(Clone)]
 pub struct PySledStore {
@@ -66,6 +67,33 @@ impl PySledStore {
         self.inner.insert(quad).map_err(map_io_err)
     }
 
+    /// Adds atomically a set of quads to the store
+    ///
+    /// :param quads: the quads to add
+    /// :type quads: iter(Quad)
+    /// :raises TypeError: if one of the given values is not a quad. In this case none of the quads is added.
+    /// :raises IOError: if an I/O error happens during the quads insertion
+    ///
+    /// >>> store = SledStore()
+    /// >>> store.extend([Quad(NamedNode('http://example.com'), NamedNode('http://example.com/p'), Literal('1'), NamedNode('http://example.com/g'))])
+    /// >>> list(store)
+    /// [<Quad subject=<NamedNode value=http://example.com> predicate=<NamedNode value=http://example.com/p> object=<Literal value=1 datatype=<NamedNode value=http://www.w3.org/2001/XMLSchema#string>> graph_name=<NamedNode value=http://example.com/g>>]
+    #[pyo3(text_signature = "($self, quads)")]
+    fn extend(&self, quads: &PyAny) -> PyResult<()> {
+        let quads = quads
+            .iter()?
+            .map(|quad| -> PyResult<Quad> { Ok(quad?.extract::<PyQuad>()?.into()) })
+            .collect::<PyResult<Vec<_>>>()?;
+        self.inner
+            .transaction(|transaction| {
+                for quad in &quads {
+                    transaction.insert(quad)?;
+                }
+                Ok(()) as Result<(), SledConflictableTransactionError<io::Error>>
+            })
+            .map_err(|e| map_io_err(e.into()))
+    }
+
     /// Removes a quad from the store
     ///
     /// :param quad: the quad to remove
@@ -124,7 +152,7 @@ impl PySledStore {
     /// Executes a `SPARQL 1.1 query <https://www.w3.org/TR/sparql11-query/>`_.
     ///
     /// :param query: the query to execute
-    /// :type query: str
+    /// :type query: str or Query
     /// :param use_default_graph_as_union: if the SPARQL query should look for triples in all the dataset graphs by default (i.e. without `GRAPH` operations). Disabled by default.
     /// :type use_default_graph_as_union: bool, optional
     /// :param default_graph: list of the graphs that should be used as the query default graph. By default, the store default graph is used.
@@ -168,7 +196,7 @@ impl PySledStore {
     )]
     fn query(
         &self,
-        query: &str,
+        query: &PyAny,
         use_default_graph_as_union: bool,
         default_graph: Option<&PyAny>,
         named_graphs: Option<&PyAny>,
@@ -235,8 +263,8 @@ impl PySledStore {
     /// For example ``application/turtle`` could also be used for `Turtle <https://www.w3.org/TR/turtle/>`_
     /// and ``application/xml`` for `RDF/XML <https://www.w3.org/TR/rdf-syntax-grammar/>`_.
     ///
-    /// :param input: The binary I/O object to read from. For example, it could be a file opened in binary mode with ``open('my_file.ttl', 'rb')``.
-    /// :type input: io.RawIOBase or io.BufferedIOBase
+    /// :param input: The binary I/O object to read from. For example, it could be a file opened in binary mode with ``open('my_file.ttl', 'rb')``. The serialization could also be given directly as :py:class:`bytes`.
+    /// :type input: io.RawIOBase or io.BufferedIOBase or bytes
     /// :param mime_type: the MIME type of the RDF serialization
     /// :type mime_type: str
     /// :param base_iri: the base IRI used to resolve the relative IRIs in the file or :py:const:`None` if relative IRI resolution should not be done
@@ -251,6 +279,11 @@ impl PySledStore {
     /// >>> store.load(io.BytesIO(b'<foo> <p> "1" .'), "text/turtle", base_iri="http://example.com/", to_graph=NamedNode("http://example.com/g"))
     /// >>> list(store)
     /// [<Quad subject=<NamedNode value=http://example.com/foo> predicate=<NamedNode value=http://example.com/p> object=<Literal value=1 datatype=<NamedNode value=http://www.w3.org/2001/XMLSchema#string>> graph_name=<NamedNode value=http://example.com/g>>]
+    ///
+    /// >>> store = SledStore()
+    /// >>> store.load(b'<http://example.com/foo> <http://example.com/p> "1" .', "application/n-triples")
+    /// >>> len(store)
+    /// 1
     #[pyo3(text_signature = "($self, data, /, mime_type, *, base_iri = None, to_graph = None)")]
     #[args(input, mime_type, "*", base_iri = "None", to_graph = "None")]
     fn load(
@@ -259,13 +292,14 @@ impl PySledStore {
         mime_type: &str,
         base_iri: Option<&str>,
         to_graph: Option<&PyAny>,
+        py: Python<'_>,
     ) -> PyResult<()> {
         let to_graph_name = if let Some(graph_name) = to_graph {
             Some(PyGraphNameRef::try_from(graph_name)?)
         } else {
             None
         };
-        let input = BufReader::new(PyFileLike::new(input));
+        let input = PyReadable::from_data(input, py);
         if let Some(graph_format) = GraphFormat::from_media_type(mime_type) {
             self.inner
                 .load_graph(
@@ -329,15 +363,15 @@ impl PySledStore {
         } else {
             None
         };
-        let output = PyFileLike::new(output);
+        let mut output = BufWriter::new(PyFileLike::new(output));
         if let Some(graph_format) = GraphFormat::from_media_type(mime_type) {
             self.inner
                 .dump_graph(
-                    output,
+                    &mut output,
                     graph_format,
                     &from_graph_name.unwrap_or(PyGraphNameRef::DefaultGraph),
                 )
-                .map_err(map_io_err)
+                .map_err(map_io_err)?;
         } else if let Some(dataset_format) = DatasetFormat::from_media_type(mime_type) {
             if from_graph_name.is_some() {
                 return Err(PyValueError::new_err(
@@ -345,14 +379,16 @@ impl PySledStore {
                 ));
             }
             self.inner
-                .dump_dataset(output, dataset_format)
-                .map_err(map_io_err)
+                .dump_dataset(&mut output, dataset_format)
+                .map_err(map_io_err)?;
         } else {
-            Err(PyValueError::new_err(format!(
+            return Err(PyValueError::new_err(format!(
                 "Not supported MIME type: {}",
                 mime_type
-            )))
+            )));
         }
+        output.into_inner().map_err(|e| map_io_err(e.into()))?;
+        Ok(())
     }
 
     /// Returns an iterator over all the store named graphs
@@ -422,6 +458,22 @@ impl PySledStore {
         }
         .map_err(map_io_err)
     }
+
+    /// Clears the store by removing all its contents
+    ///
+    /// :raises IOError: if an I/O error happens during the operation
+    ///
+    /// >>> store = SledStore()
+    /// >>> store.add(Quad(NamedNode('http://example.com'), NamedNode('http://example.com/p'), Literal('1'), NamedNode('http://example.com/g')))
+    /// >>> store.clear()
+    /// >>> list(store)
+    /// []
+    /// >>> list(store.named_graphs())
+    /// []
+    #[pyo3(text_signature = "($self)")]
+    fn clear(&self) -> PyResult<()> {
+        self.inner.clear().map_err(map_io_err)
+    }
 }
 
 #[pyproto]
@@ -455,7 +507,7 @@ impl PyIterProtocol for PySledStore {
     }
 }
 
-#[pyclass(unsendable, module = "oxigraph")]
+#[pyclass(unsendable, module = "pyoxigraph")]
 pub struct QuadIter {
     inner: SledQuadIter,
 }
@@ -474,7 +526,7 @@ impl PyIterProtocol for QuadIter {
     }
 }
 
-#[pyclass(unsendable, module = "oxigraph")]
+#[pyclass(unsendable, module = "pyoxigraph")]
 pub struct GraphNameIter {
     inner: SledGraphNameIter,
 }
@@ -10,13 +10,61 @@ use pyo3::prelude::{
 use pyo3::{PyIterProtocol, PyMappingProtocol, PyObjectProtocol};
 use std::vec::IntoIter;
 
+/// A parsed `SPARQL 1.1 query <https://www.w3.org/TR/sparql11-query/>`_
+///
+/// It could be given to the stores ``query`` methods instead of a :py:class:`str` to parse the query only once when evaluating it multiple times.
+///
+/// :param query: the query to parse
+/// :type query: str
+/// :param base_iri: the base IRI used to resolve the relative IRIs in the query or :py:const:`None` if relative IRI resolution should not be done
+/// :type base_iri: str or None, optional
+/// :raises SyntaxError: if the provided query is invalid
+///
+/// The :py:func:`str` function provides a serialization of the query:
+///
+/// >>> query = Query('SELECT ?s WHERE { ?s ?p ?o . }')
+/// >>> str(query)
+/// 'SELECT ?s WHERE { ?s ?p ?o . }'
+/// >>> store = MemoryStore()
+/// >>> store.add(Quad(NamedNode('http://example.com'), NamedNode('http://example.com/p'), Literal('1')))
+/// >>> list(solution['s'] for solution in store.query(query))
+/// [<NamedNode value=http://example.com>]
+#[pyclass(unsendable, name = "Query", module = "pyoxigraph")]
+#[pyo3(text_signature = "(query, *, base_iri = None)")]
+pub struct PyQuery {
+    inner: Query,
+}
+
+#[pymethods]
+impl PyQuery {
+    #[new]
+    #[args(query, "*", base_iri = "None")]
+    fn new(query: &str, base_iri: Option<&str>) -> PyResult<Self> {
+        Ok(Self {
+            inner: Query::parse(query, base_iri).map_err(|e| map_evaluation_error(e.into()))?,
+        })
+    }
+}
+
+#[pyproto]
+impl PyObjectProtocol for PyQuery {
+    fn __str__(&self) -> String {
+        self.inner.to_string()
+    }
+}
+
 pub fn parse_query(
-    query: &str,
+    query: &PyAny,
     use_default_graph_as_union: bool,
     default_graph: Option<&PyAny>,
     named_graphs: Option<&PyAny>,
 ) -> PyResult<Query> {
-    let mut query = Query::parse(query, None).map_err(|e| map_evaluation_error(e.into()))?;
+    // The query is cloned because its dataset is modified just after
+    let mut query = if let Ok(query) = query.extract::<PyRef<'_, PyQuery>>() {
+        query.inner.clone()
+    } else {
+        Query::parse(query.extract()?, None).map_err(|e| map_evaluation_error(e.into()))?
+    };
 
     if use_default_graph_as_union && default_graph.is_some() {
         return Err(PyValueError::new_err(
@@ -85,7 +133,7 @@ pub fn query_results_to_python(py: Python<'_>, results: QueryResults) -> PyResul
 /// >>> s, p, o = solution
 /// >>> s
 /// <NamedNode value=http://example.com>
-#[pyclass(unsendable, name = "QuerySolution", module = "oxigraph")]
+#[pyclass(unsendable, name = "QuerySolution", module = "pyoxigraph")]
 pub struct PyQuerySolution {
     inner: QuerySolution,
 }
@@ -146,7 +194,7 @@ impl PyIterProtocol for PyQuerySolution {
     }
 }
 
-#[pyclass(module = "oxigraph")]
+#[pyclass(module = "pyoxigraph")]
 pub struct SolutionValueIter {
     inner: IntoIter<Option<Term>>,
 }
@@ -168,7 +216,7 @@ impl PyIterProtocol for SolutionValueIter {
 /// >>> store.add(Quad(NamedNode('http://example.com'), NamedNode('http://example.com/p'), Literal('1')))
 /// >>> list(store.query('SELECT ?s WHERE { ?s ?p ?o }'))
 /// [<QuerySolution s=<NamedNode value=http://example.com>>]
-#[pyclass(unsendable, name = "QuerySolutions", module = "oxigraph")]
+#[pyclass(unsendable, name = "QuerySolutions", module = "pyoxigraph")]
 pub struct PyQuerySolutions {
     inner: QuerySolutionIter,
 }
@@ -213,7 +261,7 @@ impl PyIterProtocol for PyQuerySolutions {
 /// >>> store.add(Quad(NamedNode('http://example.com'), NamedNode('http://example.com/p'), Literal('1')))
 /// >>> list(store.query('CONSTRUCT WHERE { ?s ?p ?o }'))
 /// [<Triple subject=<NamedNode value=http://example.com> predicate=<NamedNode value=http://example.com/p> object=<Literal value=1 datatype=<NamedNode value=http://www.w3.org/2001/XMLSchema#string>>>]
-#[pyclass(unsendable, name = "QueryTriples", module = "oxigraph")]
+#[pyclass(unsendable, name = "QueryTriples", module = "pyoxigraph")]
 pub struct PyQueryTriples {
     inner: QueryTripleIter,
 }
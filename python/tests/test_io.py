@@ -0,0 +1,111 @@
+import unittest
+from io import BytesIO
+
+from pyoxigraph import Literal, NamedNode, Quad, Triple, parse, serialize
+
+EXAMPLE_TRIPLE = Triple(
+    NamedNode("http://example.com/foo"),
+    NamedNode("http://example.com/p"),
+    Literal("1"),
+)
+EXAMPLE_QUAD = Quad(
+    NamedNode("http://example.com/foo"),
+    NamedNode("http://example.com/p"),
+    Literal("1"),
+    NamedNode("http://example.com/g"),
+)
+
+
+class FailingOutput:
+    def write(self, data):
+        raise OSError("write failed")
+
+    def flush(self):
+        pass
+
+
+class ShortWriteOutput(BytesIO):
+    def write(self, data):
+        # Only accepts one byte at a time like a raw I/O object may do
+        return super().write(bytes(data[:1]))
+
+
+class TestParse(unittest.TestCase):
+    def test_parse_file(self):
+        self.assertEqual(
+            list(
+                parse(
+                    BytesIO(b'<foo> <p> "1" .'),
+                    "text/turtle",
+                    base_iri="http://example.com/",
+                )
+            ),
+            [EXAMPLE_TRIPLE],
+        )
+
+    def test_parse_bytes(self):
+        self.assertEqual(
+            list(
+                parse(
+                    '<foo> <p> "éù" .'.encode(),
+                    "text/turtle",
+                    base_iri="http://example.com/",
+                )
+            ),
+            [
+                Triple(
+                    NamedNode("http://example.com/foo"),
+                    NamedNode("http://example.com/p"),
+                    Literal("éù"),
+                )
+            ],
+        )
+
+    def test_parse_quad_bytes(self):
+        self.assertEqual(
+            list(
+                parse(
+                    b'<http://example.com/foo> <http://example.com/p> "1" <http://example.com/g> .',
+                    "application/n-quads",
+                )
+            ),
+            [EXAMPLE_QUAD],
+        )
+
+    def test_parse_syntax_error(self):
+        with self.assertRaises(SyntaxError):
+            list(parse(b"<foo> <p> .", "application/n-triples"))
+
+
+class TestSerialize(unittest.TestCase):
+    def test_serialize_triples(self):
+        output = BytesIO()
+        serialize([EXAMPLE_TRIPLE], output, "application/n-triples")
+        self.assertEqual(
+            output.getvalue(),
+            b'<http://example.com/foo> <http://example.com/p> "1" .\n',
+        )
+
+    def test_serialize_quads(self):
+        output = BytesIO()
+        serialize([EXAMPLE_QUAD], output, "application/n-quads")
+        self.assertEqual(
+            output.getvalue(),
+            b'<http://example.com/foo> <http://example.com/p> "1" <http://example.com/g> .\n',
+        )
+
+    def test_serialize_write_error(self):
+        with self.assertRaises(OSError):
+            serialize([EXAMPLE_TRIPLE], FailingOutput(), "application/n-triples")
+
+    def test_serialize_short_write(self):
+        output = ShortWriteOutput()
+        serialize([EXAMPLE_QUAD], output, "application/n-quads")
+        self.assertEqual(
+            output.getvalue(),
+            b'<http://example.com/foo> <http://example.com/p> "1" <http://example.com/g> .\n',
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,31 @@
+import copy
+import pickle
 import unittest
-from pyoxigraph import *
+
+from pyoxigraph import (
+    BlankNode,
+    DefaultGraph,
+    Literal,
+    NamedNode,
+    Quad,
+    Triple,
+    Variable,
+)
 
 XSD_STRING = NamedNode("http://www.w3.org/2001/XMLSchema#string")
 XSD_INTEGER = NamedNode("http://www.w3.org/2001/XMLSchema#integer")
 RDF_LANG_STRING = NamedNode("http://www.w3.org/1999/02/22-rdf-syntax-ns#langString")
+SUBJECT = NamedNode("http://example.com/s")
+PREDICATE = NamedNode("http://example.com/p")
+OBJECT = NamedNode("http://example.com/o")
+GRAPH = NamedNode("http://example.com/g")
+TRIPLE = Triple(SUBJECT, PREDICATE, OBJECT)
+QUAD = Quad(SUBJECT, PREDICATE, OBJECT, GRAPH)
+LITERALS = (
+    Literal("foo"),
+    Literal("foo", language="en"),
+    Literal("1", datatype=XSD_INTEGER),
+)
 
 
 class TestNamedNode(unittest.TestCase):
@@ -17,6 +39,14 @@ class TestNamedNode(unittest.TestCase):
         self.assertEqual(NamedNode("http://foo"), NamedNode("http://foo"))
         self.assertNotEqual(NamedNode("http://foo"), NamedNode("http://bar"))
 
+    def test_pickle(self):
+        node = NamedNode("http://foo")
+        self.assertEqual(
+            pickle.loads(pickle.dumps(node, protocol=pickle.HIGHEST_PROTOCOL)), node
+        )
+        self.assertIs(copy.copy(node), node)
+        self.assertIs(copy.deepcopy(node), node)
+
 
 class TestBlankNode(unittest.TestCase):
     def test_constructor(self):
@@ -32,6 +62,19 @@ class TestBlankNode(unittest.TestCase):
         self.assertNotEqual(BlankNode('foo'), NamedNode('http://foo'))
         self.assertNotEqual(NamedNode('http://foo'), BlankNode('foo'))
 
+    def test_pickle(self):
+        node = BlankNode("foo")
+        self.assertEqual(
+            pickle.loads(pickle.dumps(node, protocol=pickle.HIGHEST_PROTOCOL)), node
+        )
+        self.assertIs(copy.copy(node), node)
+        self.assertIs(copy.deepcopy(node), node)
+
+        auto = BlankNode()
+        self.assertEqual(
+            pickle.loads(pickle.dumps(auto, protocol=pickle.HIGHEST_PROTOCOL)), auto
+        )
+
 
 class TestLiteral(unittest.TestCase):
     def test_constructor(self):
@@ -64,121 +107,108 @@ class TestLiteral(unittest.TestCase):
         self.assertNotEqual(BlankNode('foo'), Literal('foo'))
         self.assertNotEqual(Literal('foo'), BlankNode('foo'))
 
+    def test_pickle(self):
+        for literal in LITERALS:
+            with self.subTest(literal=literal):
+                self.assertEqual(
+                    pickle.loads(
+                        pickle.dumps(literal, protocol=pickle.HIGHEST_PROTOCOL)
+                    ),
+                    literal,
+                )
+                self.assertIs(copy.copy(literal), literal)
+                self.assertIs(copy.deepcopy(literal), literal)
+
+
+class TestDefaultGraph(unittest.TestCase):
+    def test_pickle(self):
+        graph = DefaultGraph()
+        self.assertEqual(
+            pickle.loads(pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL)), graph
+        )
+        self.assertIs(copy.copy(graph), graph)
+        self.assertIs(copy.deepcopy(graph), graph)
+
 
 class TestTriple(unittest.TestCase):
     def test_constructor(self):
-        t = Triple(
-            NamedNode("http://example.com/s"),
-            NamedNode("http://example.com/p"),
-            NamedNode("http://example.com/o"),
-        )
-        self.assertEqual(t.subject, NamedNode("http://example.com/s"))
-        self.assertEqual(t.predicate, NamedNode("http://example.com/p"))
-        self.assertEqual(t.object, NamedNode("http://example.com/o"))
+        t = Triple(SUBJECT, PREDICATE, OBJECT)
+        self.assertEqual(t.subject, SUBJECT)
+        self.assertEqual(t.predicate, PREDICATE)
+        self.assertEqual(t.object, OBJECT)
 
     def test_mapping(self):
-        t = Triple(
-            NamedNode("http://example.com/s"),
-            NamedNode("http://example.com/p"),
-            NamedNode("http://example.com/o"),
-        )
-        self.assertEqual(t[0], NamedNode("http://example.com/s"))
-        self.assertEqual(t[1], NamedNode("http://example.com/p"))
-        self.assertEqual(t[2], NamedNode("http://example.com/o"))
+        self.assertEqual(TRIPLE[0], SUBJECT)
+        self.assertEqual(TRIPLE[1], PREDICATE)
+        self.assertEqual(TRIPLE[2], OBJECT)
 
     def test_destruct(self):
-        (s, p, o) = Triple(
-            NamedNode("http://example.com/s"),
-            NamedNode("http://example.com/p"),
-            NamedNode("http://example.com/o"),
-        )
-        self.assertEqual(s, NamedNode("http://example.com/s"))
-        self.assertEqual(p, NamedNode("http://example.com/p"))
-        self.assertEqual(o, NamedNode("http://example.com/o"))
+        (s, p, o) = TRIPLE
+        self.assertEqual(s, SUBJECT)
+        self.assertEqual(p, PREDICATE)
+        self.assertEqual(o, OBJECT)
 
     def test_string(self):
         self.assertEqual(
-            str(
-                Triple(
-                    NamedNode("http://example.com/s"),
-                    NamedNode("http://example.com/p"),
-                    NamedNode("http://example.com/o"),
-                )
-            ),
+            str(TRIPLE),
             "<http://example.com/s> <http://example.com/p> <http://example.com/o> .",
         )
 
+    def test_pickle(self):
+        self.assertEqual(
+            pickle.loads(pickle.dumps(TRIPLE, protocol=pickle.HIGHEST_PROTOCOL)), TRIPLE
+        )
+        self.assertIs(copy.copy(TRIPLE), TRIPLE)
+        self.assertIs(copy.deepcopy(TRIPLE), TRIPLE)
+
 
 class TestQuad(unittest.TestCase):
     def test_constructor(self):
-        t = Quad(
-            NamedNode("http://example.com/s"),
-            NamedNode("http://example.com/p"),
-            NamedNode("http://example.com/o"),
-            NamedNode("http://example.com/g"),
-        )
-        self.assertEqual(t.subject, NamedNode("http://example.com/s"))
-        self.assertEqual(t.predicate, NamedNode("http://example.com/p"))
-        self.assertEqual(t.object, NamedNode("http://example.com/o"))
-        self.assertEqual(t.graph_name, NamedNode("http://example.com/g"))
+        t = Quad(SUBJECT, PREDICATE, OBJECT, GRAPH)
+        self.assertEqual(t.subject, SUBJECT)
+        self.assertEqual(t.predicate, PREDICATE)
+        self.assertEqual(t.object, OBJECT)
+        self.assertEqual(t.graph_name, GRAPH)
+        self.assertEqual(t.triple, TRIPLE)
         self.assertEqual(
-            t.triple,
-            Triple(
-                NamedNode("http://example.com/s"),
-                NamedNode("http://example.com/p"),
-                NamedNode("http://example.com/o"),
-            ),
-        )
-        self.assertEqual(
-            Quad(
-                NamedNode("http://example.com/s"),
-                NamedNode("http://example.com/p"),
-                NamedNode("http://example.com/o"),
-            ),
-            Quad(
-                NamedNode("http://example.com/s"),
-                NamedNode("http://example.com/p"),
-                NamedNode("http://example.com/o"),
-                DefaultGraph(),
-            ),
+            Quad(SUBJECT, PREDICATE, OBJECT),
+            Quad(SUBJECT, PREDICATE, OBJECT, DefaultGraph()),
         )
 
     def test_mapping(self):
-        t = Quad(
-            NamedNode("http://example.com/s"),
-            NamedNode("http://example.com/p"),
-            NamedNode("http://example.com/o"),
-            NamedNode("http://example.com/g"),
-        )
-        self.assertEqual(t[0], NamedNode("http://example.com/s"))
-        self.assertEqual(t[1], NamedNode("http://example.com/p"))
-        self.assertEqual(t[2], NamedNode("http://example.com/o"))
-        self.assertEqual(t[3], NamedNode("http://example.com/g"))
+        self.assertEqual(QUAD[0], SUBJECT)
+        self.assertEqual(QUAD[1], PREDICATE)
+        self.assertEqual(QUAD[2], OBJECT)
+        self.assertEqual(QUAD[3], GRAPH)
 
     def test_destruct(self):
-        (s, p, o, g) = Quad(
-            NamedNode("http://example.com/s"),
-            NamedNode("http://example.com/p"),
-            NamedNode("http://example.com/o"),
-            NamedNode("http://example.com/g"),
-        )
-        self.assertEqual(s, NamedNode("http://example.com/s"))
-        self.assertEqual(p, NamedNode("http://example.com/p"))
-        self.assertEqual(o, NamedNode("http://example.com/o"))
-        self.assertEqual(g, NamedNode("http://example.com/g"))
+        (s, p, o, g) = QUAD
+        self.assertEqual(s, SUBJECT)
+        self.assertEqual(p, PREDICATE)
+        self.assertEqual(o, OBJECT)
+        self.assertEqual(g, GRAPH)
 
     def test_string(self):
         self.assertEqual(
-            str(
-                Triple(
-                    NamedNode("http://example.com/s"),
-                    NamedNode("http://example.com/p"),
-                    NamedNode("http://example.com/o"),
-                )
-            ),
+            str(TRIPLE),
             "<http://example.com/s> <http://example.com/p> <http://example.com/o> .",
         )
 
+    def test_pickle(self):
+        self.assertEqual(
+            pickle.loads(pickle.dumps(QUAD, protocol=pickle.HIGHEST_PROTOCOL)), QUAD
+        )
+        self.assertIs(copy.copy(QUAD), QUAD)
+        self.assertIs(copy.deepcopy(QUAD), QUAD)
+
+        default_graph_quad = Quad(SUBJECT, PREDICATE, OBJECT)
+        self.assertEqual(
+            pickle.loads(
+                pickle.dumps(default_graph_quad, protocol=pickle.HIGHEST_PROTOCOL)
+            ),
+            default_graph_quad,
+        )
+
 
 class TestVariable(unittest.TestCase):
     def test_constructor(self):
@@ -191,6 +221,15 @@ class TestVariable(unittest.TestCase):
         self.assertEqual(Variable("foo"), Variable("foo"))
         self.assertNotEqual(Variable("foo"), Variable("bar"))
 
+    def test_pickle(self):
+        variable = Variable("foo")
+        self.assertEqual(
+            pickle.loads(pickle.dumps(variable, protocol=pickle.HIGHEST_PROTOCOL)),
+            variable,
+        )
+        self.assertIs(copy.copy(variable), variable)
+        self.assertIs(copy.deepcopy(variable), variable)
+
 
 if __name__ == "__main__":
     unittest.main()
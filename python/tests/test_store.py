@@ -1,90 +1,175 @@
+import os
 import unittest
 from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from io import BytesIO
-
-from pyoxigraph import *
+from multiprocessing import get_context
+
+from pyoxigraph import (
+    BlankNode,
+    DefaultGraph,
+    MemoryStore,
+    NamedNode,
+    Quad,
+    Query,
+    QuerySolution,
+    QuerySolutions,
+    QueryTriples,
+    SledStore,
+    Triple,
+    Variable,
+)
+from test_io import FailingOutput, ShortWriteOutput
 
 foo = NamedNode("http://foo")
 bar = NamedNode("http://bar")
 baz = NamedNode("http://baz")
 graph = NamedNode("http://graph")
+graph2 = NamedNode("http://graph2")
+graph_bnode = BlankNode("g")
+default_quad = Quad(foo, bar, baz)
+graph_quad = Quad(foo, bar, baz, graph)
+foo_quad = Quad(foo, foo, foo)
+default_graphs = [DefaultGraph(), graph, graph_bnode]
+named_graphs = [graph, graph_bnode]
+ntriples_data = b"<http://foo> <http://bar> <http://baz> ."
+select_s_query = Query("SELECT ?s WHERE { ?s ?p ?o }")
+graphs_quads = [
+    graph_quad,
+    Quad(foo, bar, foo),
+    Quad(foo, bar, bar, graph_bnode),
+    Quad(foo, bar, bar, foo),
+]
+
+
+class NTriplesHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = ntriples_data
+        self.send_response(200)
+        self.send_header("Content-Type", "application/n-triples")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_ntriples(port_queue):
+    # Run in another process because the store methods keep the GIL while fetching.
+    # Only one request is served and waiting for it times out so that a failed test does not hang.
+    server = HTTPServer(("127.0.0.1", 0), NTriplesHandler)
+    server.timeout = 10
+    port_queue.put(server.server_address[1])
+    server.handle_request()
+    server.server_close()
+
+
+class TestQuery(unittest.TestCase):
+    def test_string(self):
+        self.assertEqual(str(select_s_query), "SELECT ?s WHERE { ?s ?p ?o . }")
+
+    def test_invalid(self):
+        with self.assertRaises(SyntaxError):
+            Query("SELECT")
+
+    def test_base_iri(self):
+        store = MemoryStore()
+        store.add(Quad(foo, NamedNode("http://example.com/p"), baz))
+        query = Query("SELECT ?s WHERE { ?s <p> ?o }", base_iri="http://example.com/")
+        self.assertEqual([solution["s"] for solution in store.query(query)], [foo])
+
+    def test_invalid_base_iri(self):
+        with self.assertRaises(SyntaxError):
+            Query("SELECT ?s WHERE { ?s <p> ?o }", base_iri="not an iri")
 
 
 class TestAbstractStore(unittest.TestCase, ABC):
+    @classmethod
     @abstractmethod
-    def store(self):
+    def new_store(cls):
         pass
 
+    @classmethod
+    def setUpClass(cls):
+        # The store is shared by all the tests of the class and emptied before each of them
+        cls.shared_store = cls.new_store()
+
+    def store(self):
+        self.shared_store.clear()
+        return self.shared_store
+
     def test_add(self):
         store = self.store()
-        store.add(Quad(foo, bar, baz))
+        store.add(default_quad)
         store.add(Quad(foo, bar, baz, DefaultGraph()))
-        store.add(Quad(foo, bar, baz, graph))
+        store.add(graph_quad)
+        self.assertEqual(len(store), 2)
+
+    def test_extend(self):
+        store = self.store()
+        store.extend([default_quad, Quad(foo, bar, baz, DefaultGraph()), graph_quad])
         self.assertEqual(len(store), 2)
 
+    def test_extend_invalid(self):
+        store = self.store()
+        with self.assertRaises(TypeError):
+            store.extend([default_quad, Triple(foo, bar, baz)])
+        self.assertEqual(len(store), 0)
+
     def test_remove(self):
         store = self.store()
-        store.add(Quad(foo, bar, baz))
-        store.add(Quad(foo, bar, baz, DefaultGraph()))
-        store.add(Quad(foo, bar, baz, graph))
-        store.remove(Quad(foo, bar, baz))
+        store.extend([default_quad, Quad(foo, bar, baz, DefaultGraph()), graph_quad])
+        store.remove(default_quad)
         self.assertEqual(len(store), 1)
 
     def test_len(self):
         store = self.store()
-        store.add(Quad(foo, bar, baz))
-        store.add(Quad(foo, bar, baz, graph))
+        store.add(default_quad)
+        store.add(graph_quad)
         self.assertEqual(len(store), 2)
 
     def test_in(self):
         store = self.store()
-        store.add(Quad(foo, bar, baz))
-        store.add(Quad(foo, bar, baz, DefaultGraph()))
-        store.add(Quad(foo, bar, baz, graph))
-        self.assertIn(Quad(foo, bar, baz), store)
+        store.extend([default_quad, Quad(foo, bar, baz, DefaultGraph()), graph_quad])
+        self.assertIn(default_quad, store)
         self.assertIn(Quad(foo, bar, baz, DefaultGraph()), store)
-        self.assertIn(Quad(foo, bar, baz, graph), store)
+        self.assertIn(graph_quad, store)
         self.assertNotIn(Quad(foo, bar, baz, foo), store)
 
     def test_iter(self):
         store = self.store()
-        store.add(Quad(foo, bar, baz, DefaultGraph()))
-        store.add(Quad(foo, bar, baz, graph))
-        self.assertEqual(
-            set(store),
-            {Quad(foo, bar, baz, DefaultGraph()), Quad(foo, bar, baz, graph)},
-        )
+        store.extend([default_quad, graph_quad])
+        self.assertCountEqual(store, [default_quad, graph_quad])
 
     def test_quads_for_pattern(self):
         store = self.store()
-        store.add(Quad(foo, bar, baz, DefaultGraph()))
-        store.add(Quad(foo, bar, baz, graph))
-        self.assertEqual(
-            set(store.quads_for_pattern(None, None, None)),
-            {Quad(foo, bar, baz, DefaultGraph()), Quad(foo, bar, baz, graph)},
+        store.extend([default_quad, graph_quad])
+        self.assertCountEqual(
+            store.quads_for_pattern(None, None, None),
+            [default_quad, graph_quad],
         )
-        self.assertEqual(
-            set(store.quads_for_pattern(foo, None, None)),
-            {Quad(foo, bar, baz, DefaultGraph()), Quad(foo, bar, baz, graph)},
+        self.assertCountEqual(
+            store.quads_for_pattern(foo, None, None),
+            [default_quad, graph_quad],
         )
-        self.assertEqual(
-            set(store.quads_for_pattern(None, None, None, graph)),
-            {Quad(foo, bar, baz, graph)},
+        self.assertCountEqual(
+            store.quads_for_pattern(None, None, None, graph),
+            [graph_quad],
         )
-        self.assertEqual(
-            set(store.quads_for_pattern(foo, None, None, DefaultGraph())),
-            {Quad(foo, bar, baz, DefaultGraph())},
+        self.assertCountEqual(
+            store.quads_for_pattern(foo, None, None, DefaultGraph()), [default_quad]
         )
 
     def test_ask_query(self):
         store = self.store()
-        store.add(Quad(foo, foo, foo))
+        store.add(foo_quad)
         self.assertTrue(store.query("ASK { ?s ?s ?s }"))
         self.assertFalse(store.query("ASK { FILTER(false) }"))
 
     def test_construct_query(self):
         store = self.store()
-        store.add(Quad(foo, bar, baz))
+        store.add(default_quad)
         results = store.query("CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }")
         self.assertIsInstance(results, QueryTriples)
         self.assertEqual(
@@ -93,7 +178,7 @@ class TestAbstractStore(unittest.TestCase, ABC):
 
     def test_select_query(self):
         store = self.store()
-        store.add(Quad(foo, bar, baz))
+        store.add(default_quad)
         solutions = store.query("SELECT ?s ?o WHERE { ?s ?p ?o }")
         self.assertIsInstance(solutions, QuerySolutions)
         self.assertEqual(solutions.variables, [Variable("s"), Variable("o")])
@@ -109,48 +194,51 @@ class TestAbstractStore(unittest.TestCase, ABC):
         self.assertEqual(s, foo)
         self.assertEqual(o, baz)
 
+    def test_prepared_query(self):
+        store = self.store()
+        store.add(default_quad)
+        query = Query("SELECT ?s ?o WHERE { ?s ?p ?o }")
+        for _ in range(2):
+            solution = next(store.query(query))
+            self.assertEqual(solution["s"], foo)
+            self.assertEqual(solution["o"], baz)
+        self.assertEqual(sum(1 for _ in store.query(query, default_graph=graph)), 0)
+        self.assertEqual(sum(1 for _ in store.query(query)), 1)
+
+    def test_invalid_query(self):
+        store = self.store()
+        with self.assertRaises(SyntaxError):
+            store.query("SELECT")
+
     def test_select_query_union_default_graph(self):
         store = self.store()
-        store.add(Quad(foo, bar, baz, graph))
-        self.assertEqual(len(list(store.query("SELECT ?s WHERE { ?s ?p ?o }"))), 0)
-        results = store.query(
-            "SELECT ?s WHERE { ?s ?p ?o }", use_default_graph_as_union=True
-        )
-        self.assertEqual(len(list(results)), 1)
+        store.add(graph_quad)
+        self.assertEqual(sum(1 for _ in store.query(select_s_query)), 0)
+        results = store.query(select_s_query, use_default_graph_as_union=True)
+        self.assertEqual(sum(1 for _ in results), 1)
         results = store.query(
-            "SELECT ?s WHERE { ?s ?p ?o }",
+            select_s_query,
             use_default_graph_as_union=True,
             named_graphs=[graph],
         )
-        self.assertEqual(len(list(results)), 1)
+        self.assertEqual(sum(1 for _ in results), 1)
 
     def test_select_query_with_default_graph(self):
         store = self.store()
-        graph_bnode = BlankNode("g")
-        store.add(Quad(foo, bar, baz, graph))
-        store.add(Quad(foo, bar, foo))
-        store.add(Quad(foo, bar, bar, graph_bnode))
-        self.assertEqual(len(list(store.query("SELECT ?s WHERE { ?s ?p ?o }"))), 1)
-        results = store.query("SELECT ?s WHERE { ?s ?p ?o }", default_graph=graph)
-        self.assertEqual(len(list(results)), 1)
-        results = store.query(
-            "SELECT ?s WHERE { ?s ?p ?o }",
-            default_graph=[DefaultGraph(), graph, graph_bnode],
-        )
-        self.assertEqual(len(list(results)), 3)
+        store.extend(graphs_quads)
+        self.assertEqual(sum(1 for _ in store.query(select_s_query)), 1)
+        results = store.query(select_s_query, default_graph=graph)
+        self.assertEqual(sum(1 for _ in results), 1)
+        results = store.query(select_s_query, default_graph=default_graphs)
+        self.assertEqual(sum(1 for _ in results), 3)
 
     def test_select_query_with_named_graph(self):
         store = self.store()
-        graph_bnode = BlankNode("g")
-        store.add(Quad(foo, bar, baz, graph))
-        store.add(Quad(foo, bar, foo))
-        store.add(Quad(foo, bar, bar, graph_bnode))
-        store.add(Quad(foo, bar, bar, foo))
+        store.extend(graphs_quads)
         results = store.query(
-            "SELECT ?s WHERE { GRAPH ?g { ?s ?p ?o } }",
-            named_graphs=[graph, graph_bnode],
+            "SELECT ?s WHERE { GRAPH ?g { ?s ?p ?o } }", named_graphs=named_graphs
         )
-        self.assertEqual(len(list(results)), 2)
+        self.assertEqual(sum(1 for _ in results), 2)
 
     def test_update_insert_data(self):
         store = self.store()
@@ -159,37 +247,53 @@ class TestAbstractStore(unittest.TestCase, ABC):
 
     def test_update_delete_data(self):
         store = self.store()
-        store.add(Quad(foo, foo, foo))
+        store.add(foo_quad)
         store.update('DELETE DATA { <http://foo> <http://foo> <http://foo> }')
         self.assertEqual(len(store), 0)
 
     def test_update_delete_where(self):
         store = self.store()
-        store.add(Quad(foo, foo, foo))
+        store.add(foo_quad)
         store.update('DELETE WHERE { ?v ?v ?v }')
         self.assertEqual(len(store), 0)
 
+    @unittest.skipUnless(
+        os.environ.get("PYOXIGRAPH_NETWORK_TESTS") == "1",
+        "network test, set PYOXIGRAPH_NETWORK_TESTS=1 to run it",
+    )
     def test_update_load(self):
         store = self.store()
         store.update('LOAD <https://www.w3.org/1999/02/22-rdf-syntax-ns>')
         self.assertGreater(len(store), 100)
 
+    def test_update_load_local(self):
+        store = self.store()
+        context = get_context("spawn")
+        port_queue = context.Queue()
+        server = context.Process(target=serve_ntriples, args=(port_queue,))
+        server.start()
+        self.addCleanup(server.join, 10)
+        self.addCleanup(server.terminate)
+        port = port_queue.get(timeout=10)
+        store.update("LOAD <http://127.0.0.1:{}/data.nt>".format(port))
+        self.assertEqual(len(store), 1)
+        self.assertIn(default_quad, store)
+
     def test_load_ntriples_to_default_graph(self):
         store = self.store()
-        store.load(
-            BytesIO(b"<http://foo> <http://bar> <http://baz> ."),
-            mime_type="application/n-triples",
-        )
-        self.assertEqual(set(store), {Quad(foo, bar, baz, DefaultGraph())})
+        store.load(ntriples_data, mime_type="application/n-triples")
+        self.assertEqual(len(store), 1)
+        self.assertIn(default_quad, store)
 
     def test_load_ntriples_to_named_graph(self):
         store = self.store()
         store.load(
-            BytesIO(b"<http://foo> <http://bar> <http://baz> ."),
+            ntriples_data,
             mime_type="application/n-triples",
             to_graph=graph,
         )
-        self.assertEqual(set(store), {Quad(foo, bar, baz, graph)})
+        self.assertEqual(len(store), 1)
+        self.assertIn(graph_quad, store)
 
     def test_load_turtle_with_base_iri(self):
         store = self.store()
@@ -198,7 +302,8 @@ class TestAbstractStore(unittest.TestCase, ABC):
             mime_type="text/turtle",
             base_iri="http://baz",
         )
-        self.assertEqual(set(store), {Quad(foo, bar, baz, DefaultGraph())})
+        self.assertEqual(len(store), 1)
+        self.assertIn(default_quad, store)
 
     def test_load_nquads(self):
         store = self.store()
@@ -206,7 +311,8 @@ class TestAbstractStore(unittest.TestCase, ABC):
             BytesIO(b"<http://foo> <http://bar> <http://baz> <http://graph>."),
             mime_type="application/n-quads",
         )
-        self.assertEqual(set(store), {Quad(foo, bar, baz, graph)})
+        self.assertEqual(len(store), 1)
+        self.assertIn(graph_quad, store)
 
     def test_load_trig_with_base_iri(self):
         store = self.store()
@@ -215,11 +321,12 @@ class TestAbstractStore(unittest.TestCase, ABC):
             mime_type="application/trig",
             base_iri="http://baz",
         )
-        self.assertEqual(set(store), {Quad(foo, bar, baz, graph)})
+        self.assertEqual(len(store), 1)
+        self.assertIn(graph_quad, store)
 
     def test_dump_ntriples(self):
         store = self.store()
-        store.add(Quad(foo, bar, baz, graph))
+        store.add(graph_quad)
         output = BytesIO()
         store.dump(output, "application/n-triples", from_graph=graph)
         self.assertEqual(
@@ -228,7 +335,7 @@ class TestAbstractStore(unittest.TestCase, ABC):
 
     def test_dump_nquads(self):
         store = self.store()
-        store.add(Quad(foo, bar, baz, graph))
+        store.add(graph_quad)
         output = BytesIO()
         store.dump(output, "application/n-quads")
         self.assertEqual(
@@ -236,10 +343,26 @@ class TestAbstractStore(unittest.TestCase, ABC):
             b"<http://foo> <http://bar> <http://baz> <http://graph> .\n",
         )
 
+    def test_dump_write_error(self):
+        store = self.store()
+        store.add(graph_quad)
+        with self.assertRaises(OSError):
+            store.dump(FailingOutput(), "application/n-quads")
+
+    def test_dump_short_write(self):
+        store = self.store()
+        store.add(graph_quad)
+        output = ShortWriteOutput()
+        store.dump(output, "application/n-quads")
+        self.assertEqual(
+            output.getvalue(),
+            b"<http://foo> <http://bar> <http://baz> <http://graph> .\n",
+        )
+
     def test_write_in_read(self):
         store = self.store()
         store.add(Quad(foo, bar, bar))
-        store.add(Quad(foo, bar, baz))
+        store.add(default_quad)
         for triple in store:
             store.add(Quad(triple.object, triple.predicate, triple.subject))
         self.assertEqual(len(store), 4)
@@ -251,21 +374,31 @@ class TestAbstractStore(unittest.TestCase, ABC):
 
     def test_remove_graph(self):
         store = self.store()
-        store.add(Quad(foo, bar, baz, graph))
-        store.add_graph(NamedNode("http://graph2"))
+        store.add(graph_quad)
+        store.add_graph(graph2)
         store.remove_graph(graph)
-        store.remove_graph(NamedNode("http://graph2"))
+        store.remove_graph(graph2)
         self.assertEqual(list(store.named_graphs()), [])
         self.assertEqual(list(store), [])
 
+    def test_clear(self):
+        store = self.store()
+        store.extend(graphs_quads)
+        store.add_graph(graph2)
+        store.clear()
+        self.assertEqual(len(store), 0)
+        self.assertEqual(list(store.named_graphs()), [])
+
 
 class TestMemoryStore(TestAbstractStore):
-    def store(self):
+    @classmethod
+    def new_store(cls):
         return MemoryStore()
 
 
 class TestSledStore(TestAbstractStore):
-    def store(self):
+    @classmethod
+    def new_store(cls):
         return SledStore()
 
 